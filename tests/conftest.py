@@ -4,6 +4,8 @@ This module provides fixtures that are available to all test modules.
 """
 
 import time
+from collections.abc import Iterator
+from pathlib import Path
 
 import pytest
 
@@ -49,6 +51,43 @@ def settings(test_settings: Settings) -> Settings:
     return test_settings
 
 
+@pytest.fixture(scope="session")
+def base_settings() -> Settings:
+    """Session-wide Settings instance built with only the required field set.
+
+    Use it for read-only assertions about defaults. Tests that mutate fields
+    should work on ``base_settings.model_copy()`` instead.
+
+    Scope: session - created once per test session for efficiency.
+
+    Returns:
+        Settings instance with every optional field left at its default
+    """
+    return Settings(discord_token="test_token")
+
+
+@pytest.fixture(scope="session", autouse=True)
+def isolated_cache_home(
+    tmp_path_factory: pytest.TempPathFactory,
+) -> Iterator[Path]:
+    """Session-wide fixture redirecting XDG_CACHE_HOME to a temporary directory.
+
+    Keeps tests (e.g. yt-dlp, which caches under $XDG_CACHE_HOME/yt-dlp) from
+    writing into the developer's real cache. One directory is shared by the
+    whole session (per worker under pytest-xdist).
+
+    Args:
+        tmp_path_factory: Pytest's session-scoped temporary path factory
+
+    Yields:
+        Path of the temporary cache directory
+    """
+    cache_home = tmp_path_factory.mktemp("cache")
+    with pytest.MonkeyPatch.context() as mp:
+        mp.setenv("XDG_CACHE_HOME", str(cache_home))
+        yield cache_home
+
+
 @pytest.fixture
 def timer():
     start = time.perf_counter()
@@ -4,19 +4,19 @@ from src.bot.dependencies.ytdlp import YTDLSource
 from src.bot.models import SearchResult, Track
 
 
-@pytest.fixture(scope="function")
+@pytest.fixture(scope="session")
 def test_url_one_track() -> str:
     """Fixture to provide a test URL for YTDLSource tests."""
     return "https://www.youtube.com/watch?v=dQw4w9WgXcQ"
 
 
-@pytest.fixture(scope="function")
+@pytest.fixture(scope="session")
 def test_url_playlist() -> str:
     """Fixture to provide a test playlist URL for YTDLSource tests."""
     return "https://www.youtube.com/watch?v=Qtogm_mo1AQ&list=PLMmqTuUsDkRIZ1C1T2AsVz5XIxtVDfSOe"
 
 
-@pytest.fixture(scope="function")
+@pytest.fixture(scope="session")
 def test_search() -> str:
     """Fixture to provide a test search query for YTDLSource tests."""
     return "Never Gonna Give You Up"